@@ -1,13 +1,8 @@
-# You only need to import the Qt version you installed.
-# This is the sort of logic that zarrview uses to load Qt.
-try:
-    from PySide6.QtWidgets import *
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import *
-    except ImportError:
-        from PyQt5.QtWidgets import *
+# zarrview resolves the installed Qt version (PySide6, PyQt6, or PyQt5) once
+# and exposes the few Qt names that scripts like this need.
+from zarrview._qt import QApplication
 
+import concurrent.futures
 import sys
 import zarr
 from zarrview.ZarrViewer import ZarrViewer
@@ -15,20 +10,37 @@ import numpy as np
 
 # example zarr hierarchy for a dataset consisting of EEG recordings across 100 trials and 64 probes
 # where each recorded waveform is a time series with 2000 samples.
+# pre-generate all random attr values in two vectorized calls
+# instead of thousands of tiny per-iteration RNG calls
+reward_probability = np.random.random(100).tolist()
+probe_location_xyz_mm = (np.random.random((100, 64, 3)) * 100).tolist()
 root = zarr.group()
-for i in range(100):
-    trial = root.create_group(f'trial.{i}')
-    trial.attrs['reward_probability'] = np.random.random()
+
+def make_probes(trial: zarr.hierarchy.Group, i: int):
     for j in range(64):
         probe = trial.create_group(f'probe.{j}')
-        probe.attrs['location_xyz_mm'] = list(np.random.random(3) * 100)
+        probe.attrs['location_xyz_mm'] = probe_location_xyz_mm[i][j]
         eeg_waveform = probe.create_dataset('eeg_waveform', shape=2000, chunks=1000)
 
+# create the trial groups serially (so probe creation never contends on a parent),
+# then fan probe creation out across a thread pool
+# (each creation is an independent metadata write that releases the GIL during I/O)
+with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+    futures = []
+    for i in range(100):
+        trial = root.create_group(f'trial.{i}')
+        trial.attrs['reward_probability'] = reward_probability[i]
+        futures.append(executor.submit(make_probes, trial, i))
+    for future in futures:
+        future.result()
+
 # create app
 app = QApplication(sys.argv)
 
 # init zarr viewer widget with root of hierarchy
-viewer = ZarrViewer(root)
+# lazy=True defers tree population until groups are expanded,
+# so showing the viewer does not block on enumerating all 6400 groups
+viewer = ZarrViewer(root, lazy=True)
 viewer.show()
 viewer.setWindowTitle('ZarrViewer')
 
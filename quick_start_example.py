@@ -1,12 +1,6 @@
-# You only need to import the Qt version you installed.
-# This is the sort of logic that zarrview uses to load Qt.
-try:
-    from PySide6.QtWidgets import *
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import *
-    except ImportError:
-        from PyQt5.QtWidgets import *
+# zarrview resolves the installed Qt version (PySide6, PyQt6, or PyQt5) once
+# and exposes the few Qt names that scripts like this need.
+from zarrview._qt import QApplication
 
 import sys
 import zarr
@@ -20,17 +14,22 @@ baz = foo.create_group('baz')
 quux = baz.create_dataset('quux', shape=200, chunks=20)
 
 # attributes for quux
-quux.attrs['a_int'] = 82
-quux.attrs['a_float'] = 3.14
-quux.attrs['a_bool'] = False
-quux.attrs['a_str'] = 'zarr-view is awesome!'
-quux.attrs['a_dict'] = {'a_child': 42}
-quux.attrs['a_list'] = [8, 4.5, True, 'hello']
+# (a single update serializes the .zattrs JSON once instead of once per key)
+quux.attrs.update({
+    'a_int': 82,
+    'a_float': 3.14,
+    'a_bool': False,
+    'a_str': 'zarr-view is awesome!',
+    'a_dict': {'a_child': 42},
+    'a_list': [8, 4.5, True, 'hello'],
+})
 
 # create app
 app = QApplication(sys.argv)
 
 # init zarr viewer widget with root of hierarchy
+# for large or remote hierarchies, consider ZarrViewer(root, lazy=True)
+# to populate the tree only as groups are expanded
 viewer = ZarrViewer(root)
 viewer.show()
 viewer.setWindowTitle('ZarrViewer')
@@ -0,0 +1,33 @@
+# zarrview resolves the installed Qt version (PySide6, PyQt6, or PyQt5) once
+# and exposes the few Qt names that scripts like this need.
+from zarrview._qt import QApplication
+
+import sys
+import zarr
+from zarrview.ZarrViewer import ZarrViewer
+
+# example zarr hierarchy for ordered runs/sweeps/channels/traces
+# (the sort of hierarchy that path slicing such as "run[0]/sweep[:2]/..." is designed for)
+#
+# build the hierarchy from a flat list of (path, shape) specs
+# directly in the on-disk store (no memory->disk copy pass afterwards)
+specs = [
+    (f'run.0/sweep.{i}/channel.{j}/trace.{k}/ydata', 1000)
+    for i in range(2)
+    for j in range(2)
+    for k in range(4)
+]
+file_root = zarr.open_group('zarr-view-run-example.zarr', 'w')
+for path, shape in specs:
+    file_root.empty(path, shape=shape)
+
+# create app
+app = QApplication(sys.argv)
+
+# init zarr viewer widget with root of hierarchy
+viewer = ZarrViewer(file_root)
+viewer.show()
+viewer.setWindowTitle('ZarrViewer')
+
+# run app
+sys.exit(app.exec())
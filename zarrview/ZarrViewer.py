@@ -42,16 +42,43 @@ except ImportError:
     Signal = pyqtSignal
     Slot = pyqtSlot
 
+import concurrent.futures
+import itertools
+import re
 import zarr
 from zarrview import zarr_path_utils as zpu
 import qtawesome as qta
 
 
+# the invalid (root) index is immutable, so share one instance instead of
+# constructing a fresh QModelIndex in hot model calls and comparisons
+# (Python evaluates default args once, so signatures are already fine)
+_ROOT_INDEX = QModelIndex()
+
+# one QIcon per glyph for the lifetime of the app
+# (qta.icon re-parses the font glyph and allocates a new QIcon on every call,
+# and Qt requests decorations for every visible row on every repaint)
+_icon_cache = {}
+
+def _icon(name: str) -> QIcon:
+    icon = _icon_cache.get(name)
+    if icon is None:
+        icon = _icon_cache[name] = qta.icon(name)
+    return icon
+
+
 class ZarrTreeItem:
     """ Each tree item corresponds to a zarr group, array, or attr.
     """
 
-    def __init__(self, 
+    # trees can hold tens of thousands of items (one per group, array, and
+    # attr leaf), so skip the per-instance __dict__
+    __slots__ = ('item_data', 'parent_item', 'child_items', '_children_loaded',
+                 '_subtree_cache', '_attr_chain_cache', '_attr_value_type_cache',
+                 '_attr_container_type_cache', '_child_zarr_key_set',
+                 '_child_attr_key_set', '_row', '_display_col0', '_display_col1')
+
+    def __init__(self,
                  data: zarr.hierarchy.Group | zarr.core.Array | str | int, 
                  parent: 'ZarrTreeItem' = None
                  ):
@@ -62,6 +89,28 @@ class ZarrTreeItem:
         self.item_data = data
         self.parent_item = parent
         self.child_items = []
+        # False only for group items whose children have yet to be
+        # enumerated from the store (lazy models, see ZarrTreeModel.fetchMore)
+        self._children_loaded = True
+        # memoized flat list of this item's subtree (see subtree_itemlist)
+        self._subtree_cache = None
+        # memoized (owner object, keychain) for attr items (see _get_attr_chain)
+        self._attr_chain_cache = None
+        # memoized type of an attr's value and of its parent container
+        # (so flags/decoration don't re-read the store per repaint)
+        self._attr_value_type_cache = None
+        self._attr_container_type_cache = None
+        # lazily built sets of child keys (zarr children and attr children)
+        # so uniqueness checks don't rescan the sibling list per candidate
+        self._child_zarr_key_set = None
+        self._child_attr_key_set = None
+        # cached position in parent_item.child_items so Qt's constant
+        # parent()/index() calls don't do a linear sibling scan
+        self._row = 0
+        # cached display strings/values so repaints don't re-split paths
+        # or re-read attrs per cell (see data() and key())
+        self._display_col0 = None
+        self._display_col1 = None
     
     def isgroup(self) -> bool:
         return isinstance(self.item_data, zarr.hierarchy.Group)
@@ -71,7 +120,7 @@ class ZarrTreeItem:
     
     def isattr(self) -> bool:
         # str dict key or int list index
-        return isinstance(self.item_data, str) | isinstance(self.item_data, int)
+        return isinstance(self.item_data, (str, int))
     
     def data(self, column: int):
         if column == 0:
@@ -82,14 +131,18 @@ class ZarrTreeItem:
                 return None
             if self.isarray():
                 # array shape and dtype summary as in zarr tree printout
-                zarray = self.item_data
-                return f"{zarray.shape} {zarray.dtype}"
+                if self._display_col1 is None:
+                    zarray = self.item_data
+                    self._display_col1 = f"{zarray.shape} {zarray.dtype}"
+                return self._display_col1
             if self.isattr():
                 # attr value (only leaf attrs)
                 if self.child_count() > 0:
                     # this is not a leaf attr (e.g., a dict or list)
                     return None
-                return self.attr()
+                if self._display_col1 is None:
+                    self._display_col1 = self.attr()
+                return self._display_col1
         return None
 
     def set_data(self, column: int, value) -> bool:
@@ -113,7 +166,9 @@ class ZarrTreeItem:
     def key(self) -> str | int:
         if self.isgroup() or self.isarray():
             # group or array name from their path
-            return self.item_data.name.strip('/').split('/')[-1]
+            if self._display_col0 is None:
+                self._display_col0 = self.item_data.name.strip('/').split('/')[-1]
+            return self._display_col0
         if self.isattr():
             # attr key/index
             return self.item_data
@@ -123,6 +178,7 @@ class ZarrTreeItem:
         if key == self.key():
             return False
         if self.isgroup() or self.isarray():
+            old_key = self.key()
             key = str(key).strip().strip('/')
             if '/' in key:
                 return False
@@ -134,18 +190,24 @@ class ZarrTreeItem:
             if new_path == old_path:
                 return False
             store = self.item_data.store
+            # cheaper (and clearer) to detect a doomed rename up front than
+            # to round-trip through an exception from the store
+            if _store_path_in_use(store, new_path):
+                return False
             try:
                 store.rename(old_path, new_path)
-            except:
+            except (KeyError, FileNotFoundError):
                 return False
             # reset this item to the new zarr object
             root_item = self.root()
             self.item_data = root_item.item_data[new_path]
+            self._display_col0 = None
             # reset all group and array items in the entire subtree
-            for item in self.subtree_itemlist():
-                old_item_path = item.item_data.path
-                new_item_path = old_item_path.replace(old_path, new_path, 1)
-                item.item_data = root_item.item_data[new_item_path]
+            self._rebind_child_zarr_objects()
+            self._invalidate_attr_chain()
+            if self.parent_item is not None:
+                self.parent_item._child_key_removed(old_key, isattr=False)
+                self.parent_item._child_key_added(key, isattr=False)
             return True
         if self.isattr():
             obj, attr_keychain = self._get_attr_chain()
@@ -153,7 +215,12 @@ class ZarrTreeItem:
                 # direct attr of group or array
                 key = self.get_unique_key(str(key))
                 obj.attrs[key] = obj.attrs.pop(attr_keychain[0])
+                old_key = self.item_data
                 self.item_data = key
+                self._invalidate_attr_chain()
+                if self.parent_item is not None:
+                    self.parent_item._child_key_removed(old_key, isattr=True)
+                    self.parent_item._child_key_added(key, isattr=True)
                 return True
             else:
                 # child attr of dict or list attr
@@ -165,53 +232,69 @@ class ZarrTreeItem:
                     key = self.get_unique_key(str(key))
                     child_attr[key] = child_attr.pop(attr_keychain[-1])
                     obj.attrs[attr_keychain[0]] = attr
+                    old_key = self.item_data
                     self.item_data = key
+                    self._invalidate_attr_chain()
+                    if self.parent_item is not None:
+                        self.parent_item._child_key_removed(old_key, isattr=True)
+                        self.parent_item._child_key_added(key, isattr=True)
                     return True
         return False
     
+    def child_key_set(self, isattr: bool) -> set:
+        # built on first use, then maintained incrementally as children
+        # are inserted/removed/renamed
+        if isattr:
+            if self._child_attr_key_set is None:
+                self._child_attr_key_set = {item.key() for item in self.child_items if item.isattr()}
+            return self._child_attr_key_set
+        if self._child_zarr_key_set is None:
+            self._child_zarr_key_set = {item.key() for item in self.child_items
+                                        if item.isgroup() or item.isarray()}
+        return self._child_zarr_key_set
+
+    def _child_key_added(self, key, isattr: bool):
+        key_set = self._child_attr_key_set if isattr else self._child_zarr_key_set
+        if key_set is not None:
+            key_set.add(key)
+
+    def _child_key_removed(self, key, isattr: bool):
+        key_set = self._child_attr_key_set if isattr else self._child_zarr_key_set
+        if key_set is not None:
+            key_set.discard(key)
+
+    # base name with an optional _N uniqueness suffix
+    _suffixed_key_regex = re.compile(r'^(.*?)(?:_(\d+))?$')
+
+    @staticmethod
+    def _unique_key(key: str, used_keys: set) -> str:
+        if key not in used_keys:
+            return key
+        # one pass over the used keys for the highest _N suffix on this base,
+        # instead of testing base_1, base_2, ... with a fresh string each
+        base = ZarrTreeItem._suffixed_key_regex.match(key).group(1)
+        prefix = base + '_'
+        max_suffix = 0
+        for used_key in used_keys:
+            if isinstance(used_key, str) and used_key.startswith(prefix):
+                suffix = used_key[len(prefix):]
+                if suffix.isdigit() and int(suffix) > max_suffix:
+                    max_suffix = int(suffix)
+        return f'{prefix}{max_suffix + 1}'
+
     def get_unique_key(self, key: str, include_self: bool = True) -> str:
         if self.parent_item is None:
             return key
-        sibling_keys = []
-        if self.isgroup() or self.isarray():
-            sibling_keys = [item.key() for item in self.parent_item.child_items 
-                            if (include_self or (item is not self)) and (item.isgroup() or item.isarray())]
-        elif self.isattr():
-            sibling_keys = [item.key() for item in self.parent_item.child_items 
-                            if (include_self or (item is not self)) and item.isattr()]
-        if key not in sibling_keys:
-            return key
-        key += '_1'
-        i = 2
-        while key in sibling_keys:
-            pos = key.rfind('_')
-            key = key[:pos+1] + str(i)
-            i += 1
-        return key
+        used_keys = self.parent_item.child_key_set(self.isattr())
+        if not include_self:
+            used_keys = used_keys - {self.key()}
+        return self._unique_key(key, used_keys)
     
     def get_unique_child_key(self, key: str) -> str:
-        child_keys = [item.key() for item in self.child_items if item.isgroup() or item.isarray()]
-        if key not in child_keys:
-            return key
-        key += '_1'
-        i = 2
-        while key in child_keys:
-            pos = key.rfind('_')
-            key = key[:pos+1] + str(i)
-            i += 1
-        return key
+        return self._unique_key(key, self.child_key_set(isattr=False))
     
     def get_unique_child_attr_key(self, key: str) -> str:
-        child_keys = [item.key() for item in self.child_items if item.isattr()]
-        if key not in child_keys:
-            return key
-        key += '_1'
-        i = 2
-        while key in child_keys:
-            pos = key.rfind('_')
-            key = key[:pos+1] + str(i)
-            i += 1
-        return key
+        return self._unique_key(key, self.child_key_set(isattr=True))
     
     def attr(self):
         if not self.isattr():
@@ -225,6 +308,8 @@ class ZarrTreeItem:
     def set_attr(self, value) -> bool:
         if not self.isattr():
             return False
+        self._attr_value_type_cache = None
+        self._display_col1 = None
         obj, attr_keychain = self._get_attr_chain()
         if len(attr_keychain) == 1:
             obj.attrs[attr_keychain[0]] = value
@@ -239,6 +324,20 @@ class ZarrTreeItem:
             return True
         return False
     
+    def attr_value_type(self) -> type | None:
+        if not self.isattr():
+            return None
+        if self._attr_value_type_cache is None:
+            self._attr_value_type_cache = type(self.attr())
+        return self._attr_value_type_cache
+
+    def attr_container_type(self) -> type | None:
+        if not self.isattr():
+            return None
+        if self._attr_container_type_cache is None:
+            self._attr_container_type_cache = type(self.attr_parent_container())
+        return self._attr_container_type_cache
+
     def attr_parent_container(self) -> zarr.hierarchy.Group | zarr.core.Array | dict | list:
         obj, attr_keychain = self._get_attr_chain()
         value = obj.attrs[attr_keychain[0]]
@@ -249,35 +348,69 @@ class ZarrTreeItem:
     def _get_attr_chain(self) -> tuple[zarr.hierarchy.Group | zarr.core.Array, list[str | int]]:
         if not self.isattr():
             return None
-        item = self
-        attr_keychain = []
-        while item.isattr() and item.parent_item:
-            attr_keychain.insert(0, item.item_data)
-            item = item.parent_item
-        obj = item.item_data
-        return obj, attr_keychain
-    
-    def add_existing_child_groups(self, isrecursive: bool = True):
-        if not self.isgroup():
-            return
-        for name, group in self.item_data.groups():
-            child_item = ZarrTreeItem(group, self)
-            self.child_items.append(child_item)
-            if isrecursive:
-                child_item.add_existing_child_groups()
+        if self._attr_chain_cache is None:
+            item = self
+            attr_keychain = []
+            while item.isattr() and item.parent_item:
+                attr_keychain.insert(0, item.item_data)
+                item = item.parent_item
+            obj = item.item_data
+            self._attr_chain_cache = (obj, attr_keychain)
+        return self._attr_chain_cache
+
+    def _invalidate_attr_chain(self):
+        # this item's key or owner object changed,
+        # so its chain and every descendant's chain are stale
+        for item in self.iter_subtree():
+            item._attr_chain_cache = None
+            if item.isattr():
+                item._display_col1 = None
     
-    def add_existing_child_arrays(self):
+    def add_existing_children(self,
+                              include_arrays: bool = True,
+                              include_groups: bool = True,
+                              include_attrs: bool = False,
+                              isrecursive: bool = True
+                              ):
+        # one store scan discovers both child groups and child arrays
+        # (groups are listed before arrays as in zarr tree printouts);
+        # attrs are folded into the same pass so the tree is not walked
+        # a second time just to populate them
         if not self.isgroup():
+            if include_attrs:
+                self.add_existing_child_attrs(isrecursive=True)
             return
-        for name, array in self.item_data.arrays():
-            child_item = ZarrTreeItem(array, self)
-            self.child_items.append(child_item)
+        group_items = []
+        array_items = []
+        if include_arrays or include_groups:
+            for name, obj in self.item_data.items():
+                if isinstance(obj, zarr.hierarchy.Group):
+                    if include_groups:
+                        group_items.append(ZarrTreeItem(obj, self))
+                elif include_arrays:
+                    array_items.append(ZarrTreeItem(obj, self))
+            start = len(self.child_items)
+            self.child_items.extend(group_items)
+            self.child_items.extend(array_items)
+            self._renumber_children(start)
+            self._child_zarr_key_set = None
+            self._invalidate_subtree_cache()
+        if isrecursive:
+            for child_item in group_items:
+                child_item.add_existing_children(include_arrays, include_groups, include_attrs, isrecursive)
+        if include_attrs:
+            # arrays are leaves, so fill in their attrs even when not
+            # recursing into child groups (e.g., lazy fetchMore)
+            for child_item in array_items:
+                child_item.add_existing_child_attrs(isrecursive=True)
+            # own attrs follow any zarr children, as elsewhere in the tree
+            self.add_existing_child_attrs(isrecursive=True)
     
     def add_existing_child_attrs(self, isrecursive: bool = True):
         if self.isgroup() or self.isarray():
             for key in self.item_data.attrs:
                 child_item = ZarrTreeItem(str(key), self)
-                self.child_items.append(child_item)
+                self._append_child(child_item)
                 if isrecursive:
                     child_item.add_existing_child_attrs()
         elif self.isattr():
@@ -285,13 +418,13 @@ class ZarrTreeItem:
             if isinstance(attr, dict):
                 for key in attr:
                     child_item = ZarrTreeItem(str(key), self)
-                    self.child_items.append(child_item)
+                    self._append_child(child_item)
                     if isrecursive:
                         child_item.add_existing_child_attrs()
             elif isinstance(attr, list):
                 for i in range(len(attr)):
                     child_item = ZarrTreeItem(i, self)
-                    self.child_items.append(child_item)
+                    self._append_child(child_item)
                     if isrecursive:
                         child_item.add_existing_child_attrs()
     
@@ -311,9 +444,18 @@ class ZarrTreeItem:
 
     def child_number(self) -> int:
         if self.parent_item:
-            return self.parent_item.child_items.index(self)
+            return self._row
         return 0
 
+    def _append_child(self, child_item: 'ZarrTreeItem'):
+        child_item._row = len(self.child_items)
+        self.child_items.append(child_item)
+
+    def _renumber_children(self, start: int = 0):
+        child_items = self.child_items
+        for i in range(start, len(child_items)):
+            child_items[i]._row = i
+
     def row(self) -> int:
         return self.child_number()
     
@@ -339,6 +481,9 @@ class ZarrTreeItem:
         group = self.item_data.create_group(key)
         child_item = ZarrTreeItem(group, self)
         self.child_items.insert(position, child_item)
+        self._renumber_children(position)
+        self._child_key_added(key, isattr=False)
+        self._invalidate_subtree_cache()
         return True
     
     def insert_child_attr(self, position: int, key: str | int = None, value = None) -> bool:
@@ -354,6 +499,9 @@ class ZarrTreeItem:
             self.item_data.attrs[key] = value
             child_item = ZarrTreeItem(key, self)
             self.child_items.insert(position, child_item)
+            self._renumber_children(position)
+            self._child_key_added(key, isattr=True)
+            self._invalidate_subtree_cache()
             return True
         elif self.isattr():
             obj, attr_keychain = self._get_attr_chain()
@@ -371,15 +519,24 @@ class ZarrTreeItem:
                 obj.attrs[attr_keychain[0]] = attr
                 child_item = ZarrTreeItem(key, self)
                 self.child_items.insert(position, child_item)
+                self._renumber_children(position)
+                self._child_key_added(key, isattr=True)
+                self._invalidate_subtree_cache()
                 return True
             elif isinstance(child_attr, list):
                 child_attr.insert(position, value)
                 obj.attrs[attr_keychain[0]] = attr
                 child_item = ZarrTreeItem(position, self)
+                child_item._row = position
                 self.child_items.insert(position, child_item)
-                # update indices of other child items
-                for i in range(position + 1, len(self.child_items)):
-                    self.child_items[i].item_data += 1
+                self._invalidate_subtree_cache()
+                # shift the indices (and cached rows) of the remaining
+                # children in one C-level pass over the tail
+                for child in itertools.islice(self.child_items, position + 1, None):
+                    child.item_data += 1
+                    child._row += 1
+                    child._invalidate_attr_chain()
+                self._child_attr_key_set = None
                 return True
         return False
     
@@ -411,25 +568,32 @@ class ZarrTreeItem:
         root = self.root().item_data
         src_path = self.item_data.path
         dst_path = dst_parent.item_data.path + '/' + src_key
+        # the sibling-key check above only covers items in the (possibly
+        # path-sliced) tree, so also check the store itself
+        if _store_path_in_use(root.store, dst_path):
+            return False
         try:
             root.store.rename(src_path, dst_path)
-        except:
+        except (KeyError, FileNotFoundError):
             return False
         
         # move item in hierarchy
-        self.parent_item.child_items.remove(self)
+        src_parent = self.parent_item
+        src_row = self._row
+        src_parent.child_items.remove(self)
+        src_parent._renumber_children(src_row)
+        src_parent._child_key_removed(src_key, isattr=False)
+        self._invalidate_subtree_cache()
         self.parent_item = dst_parent
         dst_parent.child_items.insert(dst_position, self)
+        dst_parent._renumber_children(dst_position)
+        dst_parent._child_key_added(src_key, isattr=False)
+        dst_parent._invalidate_subtree_cache()
 
         # reset all group and array items in the entire moved subtree
-        for item in self.subtree_itemlist():
-            if item.isgroup() or item.isarray():
-                old_item_path = item.item_data.path
-                new_item_path = old_item_path.replace(src_path, dst_path, 1)
-                item.item_data = root[new_item_path]
-        
-        # print(root.tree())
-        # self.root().dump()
+        self.item_data = root[dst_path]
+        self._rebind_child_zarr_objects()
+        self._invalidate_attr_chain()
         return True
     
     def insert_children(self, position: int, count: int, columns: int) -> bool:
@@ -440,38 +604,59 @@ class ZarrTreeItem:
             # default to inserting an undefined item
             item = ZarrTreeItem(None, self)
             self.child_items.insert(position, item)
+        self._renumber_children(position)
 
+        self._invalidate_subtree_cache()
         return True
 
     def remove_children(self, position: int, count: int) -> bool:
         if position < 0 or position + count > len(self.child_items):
             return False
 
+        # coalesce root-attr rewrites so that removing N children of the same
+        # dict/list attr serializes the attr JSON once instead of N times
+        pending_attr_writes = {}
+
         for row in range(count):
             # remove item's branch from tree
             item: ZarrTreeItem = self.child_items.pop(position)
 
             # delete associated object in zarr hierarchy
             if item.isgroup() or item.isarray():
+                self._child_key_removed(item.key(), isattr=False)
                 item.item_data.store.rmdir(item.item_data.path)
             elif item.isattr():
                 key = item.item_data
+                self._child_key_removed(key, isattr=True)
                 obj, attr_keychain = item._get_attr_chain()
                 if len(attr_keychain) == 1:
                     # direct attr of group or array
                     del obj.attrs[key]
                 else:
                     # child attr of dict or list attr
-                    attr = obj.attrs[attr_keychain[0]]
+                    attr_id = (id(obj), attr_keychain[0])
+                    if attr_id in pending_attr_writes:
+                        attr = pending_attr_writes[attr_id][-1]
+                    else:
+                        attr = obj.attrs[attr_keychain[0]]
+                        pending_attr_writes[attr_id] = (obj, attr_keychain[0], attr)
                     child_attr = attr
                     for i in range(1, len(attr_keychain) - 1):
                         child_attr = child_attr[attr_keychain[i]]
                     del child_attr[key]
-                    obj.attrs[attr_keychain[0]] = attr
                     if isinstance(child_attr, list):
                         # update indices of remaining child items
-                        for i in range(position, len(self.child_items)):
-                            self.child_items[i].item_data -= 1
+                        # (must happen per pop so the next pop's key is current)
+                        for child in itertools.islice(self.child_items, position, None):
+                            child.item_data -= 1
+                            child._invalidate_attr_chain()
+                        self._child_attr_key_set = None
+
+        for obj, root_key, attr in pending_attr_writes.values():
+            obj.attrs[root_key] = attr
+
+        self._renumber_children(position)
+        self._invalidate_subtree_cache()
         return True
 
     def insert_columns(self, position: int, columns: int) -> bool:
@@ -515,58 +700,146 @@ class ZarrTreeItem:
         for child_item in self.child_items:
             child_item.dump()
     
+    def _rebind_child_zarr_objects(self):
+        # after this item's zarr object has been rebound (rename/move),
+        # resolve each descendant from its already-rebound parent with a
+        # single-key access instead of an O(depth) walk from the root
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            for child_item in item.child_items:
+                if child_item.isgroup() or child_item.isarray():
+                    child_item.item_data = item.item_data[child_item.key()]
+                    stack.append(child_item)
+
+    def subtree_depth(self) -> int:
+        # deepest descendant level relative to this item
+        max_depth = 0
+        stack = [(self, 0)]
+        while stack:
+            item, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            next_depth = depth + 1
+            for child_item in item.child_items:
+                stack.append((child_item, next_depth))
+        return max_depth
+
+    def iter_subtree(self):
+        # preorder over this item and all of its descendants,
+        # iterative so deep trees cost neither call frames nor temp lists
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(reversed(item.child_items))
+
     def subtree_itemlist(self) -> list['ZarrTreeItem']:
-        items = [self]
-        for child_item in self.child_items:
-            items.extend(child_item.subtree_itemlist())
-        return items
+        if self._subtree_cache is None:
+            self._subtree_cache = list(self.iter_subtree())
+        return self._subtree_cache
+
+    def _invalidate_subtree_cache(self):
+        # a structural change below this item stales the memoized
+        # subtree list of this item and of every ancestor
+        item = self
+        while item is not None:
+            item._subtree_cache = None
+            item = item.parent_item
 
     def subtree_zarrlist(self, 
                          include_arrays: bool = True, 
                          include_groups: bool = True
                          ) -> list[zarr.hierarchy.Group | zarr.core.Array]:
         zarr_objects = []
-        for item in self.subtree_itemlist():
+        for item in self.iter_subtree():
             if (include_groups and item.isgroup()) or (include_arrays and item.isarray()):
                 zarr_objects.append(item.item_data)
         return zarr_objects
 
 
-def build_tree(root: zarr.hierarchy.Group | zarr.core.Array, 
+def _store_path_in_use(store, path: str) -> bool:
+    # a group or array already lives at this store path
+    return zarr.storage.contains_group(store, path) or zarr.storage.contains_array(store, path)
+
+
+def _is_remote_store(store) -> bool:
+    # thread-parallel scanning only pays off when each listing is a network round trip
+    try:
+        from zarr.storage import FSStore
+    except ImportError:
+        return False
+    return isinstance(store, FSStore)
+
+
+def _build_tree_parallel(root_item: ZarrTreeItem,
+                         include_arrays: bool = True,
+                         include_groups: bool = True,
+                         max_workers: int = 16
+                         ):
+    """ BFS over the hierarchy with one listing task per group,
+        so independent store round-trips overlap.
+
+        Children are only attached on the calling thread.
+    """
+    def list_children(item: ZarrTreeItem):
+        group = item.item_data
+        groups = list(group.groups()) if include_groups else []
+        arrays = list(group.arrays()) if include_arrays else []
+        return item, groups, arrays
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(list_children, root_item)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                item, groups, arrays = future.result()
+                for name, group in groups:
+                    child_item = ZarrTreeItem(group, item)
+                    item._append_child(child_item)
+                    pending.add(executor.submit(list_children, child_item))
+                for name, array in arrays:
+                    item._append_child(ZarrTreeItem(array, item))
+
+
+def build_tree(root: zarr.hierarchy.Group | zarr.core.Array,
                path: str = None,
-               include_attrs: bool = False, 
-               include_arrays: bool = True, 
-               include_groups: bool = True
+               include_attrs: bool = False,
+               include_arrays: bool = True,
+               include_groups: bool = True,
+               lazy: bool = False
                ) -> ZarrTreeItem:
     root_item = ZarrTreeItem(root)
+    if lazy and path is None:
+        # children will be populated on demand (see ZarrTreeModel.fetchMore)
+        root_item._children_loaded = False
+        return root_item
     if path is None:
-        if include_groups:
-            root_item.add_existing_child_groups(isrecursive=True)
-        if include_arrays:
-            items = root_item.subtree_itemlist()
-            for item in items:
-                item.add_existing_child_arrays()
+        if root_item.isgroup() and _is_remote_store(root.store):
+            _build_tree_parallel(root_item, include_arrays, include_groups)
+        else:
+            root_item.add_existing_children(include_arrays, include_groups, include_attrs,
+                                            isrecursive=True)
+            return root_item
     else:
         leaves = zpu.find_leaves(root, path, include_arrays, include_groups)
+        # trie-style construction: leaves share path prefixes, so track the
+        # item already created for each zarr path instead of linearly
+        # scanning siblings (and re-resolving the object) per segment
+        items_by_path = {}
         for leaf in leaves:
             leaf_path_parts = leaf.path.strip('/').split('/')
             item = root_item
             for i in range(len(leaf_path_parts)):
                 obj_path = '/'.join(leaf_path_parts[:i+1])
-                obj = root[obj_path]
-                obj_in_tree = False
-                for j in range(len(item.child_items)):
-                    child_item = item.child_items[j]
-                    if child_item.item_data == obj:
-                        obj_in_tree = True
-                        break
-                if not obj_in_tree:
-                    child_item = ZarrTreeItem(obj, item)
-                    item.child_items.append(child_item)
+                child_item = items_by_path.get(obj_path)
+                if child_item is None:
+                    child_item = ZarrTreeItem(root[obj_path], item)
+                    item._append_child(child_item)
+                    items_by_path[obj_path] = child_item
                 item = child_item
     if include_attrs:
-        items = root_item.subtree_itemlist()
-        for item in items:
+        for item in list(root_item.iter_subtree()):
             item.add_existing_child_attrs(isrecursive=True)
     return root_item
 
@@ -576,32 +849,51 @@ class ZarrTreeModel(QAbstractItemModel):
     infoChanged = Signal(QModelIndex)
     maxDepthChanged = Signal(int)
     
-    def __init__(self,  
-                 root: zarr.hierarchy.Group | zarr.core.Array, 
+    def __init__(self,
+                 root: zarr.hierarchy.Group | zarr.core.Array,
                  path: str = None,
-                 include_attrs: bool = False, 
-                 include_arrays: bool = True, 
+                 include_attrs: bool = False,
+                 include_arrays: bool = True,
                  include_groups: bool = True,
+                 lazy: bool = False,
                  parent: QObject = None
                  ):
         QAbstractItemModel.__init__(self, parent)
 
-        self.root_item = build_tree(root, path, include_attrs, include_arrays, include_groups)
+        self._lazy = lazy
+        self._include_attrs = include_attrs
+        self._include_arrays = include_arrays
+        self._include_groups = include_groups
+        self._max_depth_cache = None
+        self.root_item = build_tree(root, path, include_attrs, include_arrays, include_groups, lazy)
 
-    def reset_model(self, 
-                    root: zarr.hierarchy.Group | zarr.core.Array = None, 
+    def reset_model(self,
+                    root: zarr.hierarchy.Group | zarr.core.Array = None,
                     path: str = None,
-                    include_attrs: bool = False, 
-                    include_arrays: bool = True, 
-                    include_groups: bool = True
+                    include_attrs: bool = False,
+                    include_arrays: bool = True,
+                    include_groups: bool = True,
+                    lazy: bool = False
                     ):
         if root is None:
             root = self.root_item.item_data
-        
+
         self.beginResetModel()
-        self.root_item = build_tree(root, path, include_attrs, include_arrays, include_groups)
+        self._lazy = lazy
+        self._include_attrs = include_attrs
+        self._include_arrays = include_arrays
+        self._include_groups = include_groups
+        self._max_depth_cache = None
+        self.root_item = build_tree(root, path, include_attrs, include_arrays, include_groups, lazy)
         self.endResetModel()
-    
+
+    def reset_root_item(self, root_item: ZarrTreeItem):
+        # swap in an externally built tree (see _HierarchyScanner)
+        self.beginResetModel()
+        self._max_depth_cache = None
+        self.root_item = root_item
+        self.endResetModel()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid() and parent.column() > 0:
             return 0
@@ -611,6 +903,51 @@ class ZarrTreeModel(QAbstractItemModel):
             return 0
         return parent_item.child_count()
 
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        parent_item: ZarrTreeItem = self.get_item(parent)
+        if parent_item.isgroup() and not parent_item._children_loaded:
+            # assume a group may have children without enumerating the store
+            return True
+        return self.rowCount(parent) > 0
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        parent_item: ZarrTreeItem = self.get_item(parent)
+        return parent_item.isgroup() and not parent_item._children_loaded
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        parent_item: ZarrTreeItem = self.get_item(parent)
+        if not parent_item.isgroup() or parent_item._children_loaded:
+            return
+        parent_item._children_loaded = True
+        # enumerate the children into a staging item,
+        # then splice them into the model in a single batch
+        staging_item = ZarrTreeItem(parent_item.item_data)
+        staging_item.add_existing_children(self._include_arrays, self._include_groups,
+                                           self._include_attrs, isrecursive=False)
+        child_items = staging_item.child_items
+        if not child_items:
+            return
+        self.beginInsertRows(parent, 0, len(child_items) - 1)
+        for child_item in child_items:
+            child_item.parent_item = parent_item
+            if child_item.isgroup():
+                child_item._children_loaded = False
+        parent_item.child_items = child_items
+        parent_item._renumber_children()
+        parent_item._child_zarr_key_set = None
+        parent_item._child_attr_key_set = None
+        parent_item._invalidate_subtree_cache()
+        old_max_depth = self._max_depth_cache
+        self._invalidate_max_depth()
+        self.endInsertRows()
+        # a lazy fetch is the only row insertion that happens outside the
+        # depth-aware edit paths, so keep depth-dependent UI (e.g. the
+        # expand-to-depth spinbox) in sync as deeper levels are discovered
+        if old_max_depth is not None:
+            new_max_depth = self.max_depth()
+            if new_max_depth != old_max_depth:
+                self.maxDepthChanged.emit(new_max_depth)
+
     def columnCount(self, parent: QModelIndex = None) -> int:
         return 2
 
@@ -639,11 +976,11 @@ class ZarrTreeModel(QAbstractItemModel):
 
     def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
         if parent.isValid() and parent.column() != 0:
-            return QModelIndex()
+            return _ROOT_INDEX
 
         parent_item: ZarrTreeItem = self.get_item(parent)
         if not parent_item:
-            return QModelIndex()
+            return _ROOT_INDEX
 
         child_item: ZarrTreeItem = parent_item.child(row)
         if child_item:
@@ -651,7 +988,7 @@ class ZarrTreeModel(QAbstractItemModel):
         return QModelIndex()
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
-        if index == QModelIndex():
+        if index == _ROOT_INDEX:
             # allow drag-n-grop onto root (viewport)
             return Qt.ItemFlag.ItemIsDropEnabled
         if not index.isValid():
@@ -664,7 +1001,7 @@ class ZarrTreeModel(QAbstractItemModel):
                 return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
                         | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
             if item.isattr():
-                if isinstance(item.attr_parent_container(), list):
+                if item.attr_container_type() is list:
                     # list indices are not editable
                     return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
         elif index.column() == 1:
@@ -675,8 +1012,7 @@ class ZarrTreeModel(QAbstractItemModel):
                 if item.child_count() > 0:
                     # not a leaf attr -> dict or list
                     return Qt.ItemFlag.NoItemFlags
-                attr = item.attr()
-                if isinstance(attr, dict) or isinstance(attr, list):
+                if item.attr_value_type() in (dict, list):
                     # dict or list do not have a directly editable value
                     return Qt.ItemFlag.NoItemFlags
 
@@ -694,15 +1030,15 @@ class ZarrTreeModel(QAbstractItemModel):
         if role == Qt.ItemDataRole.DecorationRole:
             if index.column() == 0:
                 if item.isgroup():
-                    return qta.icon('ph.folder-open-fill')
+                    return _icon('ph.folder-open-fill')
                 elif item.isarray():
-                    return qta.icon('ph.cube-thin')
+                    return _icon('ph.cube-thin')
                 elif item.isattr():
-                    value = item.attr()
-                    if isinstance(value, dict):
-                        return qta.icon('ph.folder-thin')
-                    elif isinstance(value, list):
-                        return qta.icon('ph.list-numbers-thin')
+                    value_type = item.attr_value_type()
+                    if value_type is dict:
+                        return _icon('ph.folder-thin')
+                    elif value_type is list:
+                        return _icon('ph.list-numbers-thin')
 
         return None
 
@@ -716,22 +1052,25 @@ class ZarrTreeModel(QAbstractItemModel):
         if not result:
             return False
         
-        # # if we changed the index of an attr in a list,
-        # # we need to update all items in the list
-        # if (index.column() == 0) and (item.parent() is not None) and item.isattr() \
-        # and isinstance(item.attr_parent_container(), list):
-        #     parent_index = self.parent(index)
-        #     num_children = item.parent().child_count()
-        #     top_left_index = self.index(0, 0, parent_index)
-        #     bottom_right_index = self.index(num_children - 1, 1, parent_index)
-        #     self.dataChanged.emit(top_left_index, bottom_right_index, 
-        #                         [Qt.DisplayRole, Qt.EditRole])
-        #     return True
+        # if we changed the index of an attr in a list, the indices of its
+        # siblings shift too, so emit one range spanning all of them
+        # (a single batched emit, not one per reindexed cell)
+        if (index.column() == 0) and (item.parent() is not None) and item.isattr() \
+        and item.attr_container_type() is list:
+            parent_index = self.parent(index)
+            num_children = item.parent().child_count()
+            top_left_index = self.index(0, 0, parent_index)
+            bottom_right_index = self.index(num_children - 1, 1, parent_index)
+            self.dataChanged.emit(top_left_index, bottom_right_index,
+                                  [Qt.DisplayRole, Qt.EditRole])
+            return True
 
+        # renames rebind descendant zarr objects, but their displayed keys
+        # and values are unchanged, so only the edited cell needs an emit
         self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
 
         if (index.column() == 0) and (item.isgroup() or item.isarray()):
-            # zaar object path has changed
+            # zarr object path has changed
             self.infoChanged.emit(index)
 
         return True
@@ -766,6 +1105,7 @@ class ZarrTreeModel(QAbstractItemModel):
         self.beginInsertRows(parent, position, position)
         success: bool = parent_item.insert_child_group(position, key)
         self.endInsertRows()
+        self._invalidate_max_depth()
 
         return success
     
@@ -781,6 +1121,7 @@ class ZarrTreeModel(QAbstractItemModel):
         self.beginInsertRows(parent, position, position)
         success: bool = parent_item.insert_child_attr(position, key, value)
         self.endInsertRows()
+        self._invalidate_max_depth()
 
         return success
     
@@ -794,6 +1135,7 @@ class ZarrTreeModel(QAbstractItemModel):
         column_count = self.root_item.column_count()
         success: bool = parent_item.insert_children(position, rows, column_count)
         self.endInsertRows()
+        self._invalidate_max_depth()
 
         return success
 
@@ -806,6 +1148,7 @@ class ZarrTreeModel(QAbstractItemModel):
         self.beginRemoveRows(parent, position, position + rows - 1)
         success: bool = parent_item.remove_children(position, rows)
         self.endRemoveRows()
+        self._invalidate_max_depth()
 
         return success
 
@@ -832,131 +1175,140 @@ class ZarrTreeModel(QAbstractItemModel):
                 destinationParent: QModelIndex, destinationChild: int):
         if sourceParent == destinationParent:
             return False
-        if sourceRow < 0 or sourceRow >= self.rowCount(sourceParent):
+
+        # resolve both parent items once and bounds-check against them
+        # directly instead of re-resolving through rowCount
+        source_parent_item = self.get_item(sourceParent)
+        dest_parent_item = self.get_item(destinationParent)
+        if sourceRow < 0 or sourceRow >= source_parent_item.child_count():
             return False
         # destinationChild = -1 --> append as last child
-        if destinationChild < -1 or destinationChild > self.rowCount(destinationParent):
+        if destinationChild < -1 or destinationChild > dest_parent_item.child_count():
             return False
 
-        source_parent_item = self.get_item(sourceParent)
         source_item = source_parent_item.child(sourceRow)
-        dest_parent_item = self.get_item(destinationParent)
         
         self.beginMoveRows(sourceParent, sourceRow, sourceRow, destinationParent, destinationChild)
         success: bool = source_item.move_to(dest_parent_item, destinationChild)
         self.endMoveRows()
+        if success and self._max_depth_cache is not None:
+            # only the moved subtree's depths changed, so an O(moved) walk
+            # settles the common case; a full recompute is only needed if
+            # the move may have removed the deepest branch
+            new_depth = source_item.depth() + source_item.subtree_depth()
+            if new_depth >= self._max_depth_cache:
+                self._max_depth_cache = new_depth
+            else:
+                self._invalidate_max_depth()
+        else:
+            self._invalidate_max_depth()
         return success
     
     def supportedDropActions(self) -> Qt.DropActions:
         return Qt.DropAction.MoveAction #| Qt.DropAction.CopyAction
-    
-    """ unused stuff for drag-n-drop
-    # def mimeTypes(self) -> list[str]:
-    #     return ['ZarrTreeItem']
-    
-    # def mimeData(self, indexes: list[QModelIndex]) -> QMimeData:
-    #     self._internalMoveData = indexes
-
-    #     print('--------------------')
-    #     print('mimeData:')
-    #     for index in indexes:
-    #         item = self.get_item(index)
-    #         print(item.item_data)
-    #     print('--------------------')
-
-    #     # encode ZarrTreeItem into a QByteArray
-    #     # encoded_data = QByteArray()
-    #     # stream = QDataStream(encoded_data, QIODevice.WriteOnly)
-    #     # stream.writeInt(len(indexes))
-    #     # for index in indexes:
-    #     #     item: ZarrTreeItem = self.get_item(index)
-    #     #     stream.writeQVariant(QVariant(item))
-
-    #     # data = QMimeData()
-    #     # data.setData('InternalMove', encoded_data)
-    #     # return data
-    
-    #     return QMimeData()
-    
-    # def canDropMimeData(self, data: QMimeData, action: Qt.DropAction, 
-    #                     row: int, column: int, parent: QModelIndex) -> bool:
-    #     if getattr(self, '_internalMoveData', None) is None:
-    #         print('no')
-    #         return False
-    #     # if not data.hasFormat('InternalMove'):
-    #     #     return False
-
-    #     if column != 0:
-    #         # only drop on first column with tree hierarchy
-    #         print('no')
-    #         return False
-
-    #     print('yes')
-    #     return True
-    
-    # def dropMimeData(self, data: QMimeData, action: Qt.DropAction,
-    #                  row: int, column: int, parent: QModelIndex) -> bool:
-    #     print('dropMimeData')
-    #     if not self.canDropMimeData(data, action, row, column, parent):
-    #         return False
-        
-    #     if action == Qt.DropAction.IgnoreAction:
-    #         return False
-        
-    #     src_indexes = getattr(self, '_internalMoveData', None)
-    #     if src_indexes is None:
-    #         return False
-    #     # print(src_indexes[0].row(), src_indexes[0].column())
-        
-    #     dst_parent_item = self.get_item(parent)
-    #     # print(dst_parent_item.item_data.tree())
-    #     for i, src_index in enumerate(src_indexes):
-    #         src_parent_index = self.parent(src_index)
-    #         # src_parent_item = self.get_item(src_parent_index)
-    #         # src_item = self.get_item(src_index)
-    #         # print(src_item.item_data.tree())
-    #         self.moveRow(src_parent_index, src_index.row(), parent, row + i)
-        
-    #     # encoded_data: QByteArray = data.data('InternalMove')
-    #     # stream = QDataStream(encoded_data, QIODevice.ReadOnly)
-    #     # num_items = stream.readInt()
-    #     # print(num_items)
-    #     # for i in range(num_items):
-    #     #     item = ZarrTreeItem(stream.readQVariant())
-    #     #     print(item)
-    #     #     item.move_to(parent_item, row + i)
-    #     self._internalMoveMimeData = None
-    #     print('... dropMimeData')
-    #     return True
-    """
-    
-    def _repr_recursion(self, item: ZarrTreeItem, indent: int = 0) -> str:
-        result = " " * indent + repr(item) + "\n"
-        for child in item.child_items:
-            result += self._repr_recursion(child, indent + 2)
-        return result
 
     def __repr__(self) -> str:
-        return self._repr_recursion(self.root_item)
+        # iterative DFS collecting into a list: one join instead of a
+        # quadratic chain of string concatenations, and no recursion limit
+        parts = []
+        stack = [(self.root_item, 0)]
+        while stack:
+            item, indent = stack.pop()
+            parts.append(" " * indent + repr(item) + "\n")
+            child_indent = indent + 2
+            for child in reversed(item.child_items):
+                stack.append((child, child_indent))
+        return "".join(parts)
     
     def max_depth(self) -> int:
-        max_depth = 0
-        items = self.root_item.subtree_itemlist()
-        for item in items:
-            depth = item.depth()
-            if depth > max_depth:
-                max_depth = depth
-        return max_depth
+        # recomputed only after a structural change (see _invalidate_max_depth)
+        if self._max_depth_cache is None:
+            # DFS carrying the depth on the stack, so no per-item
+            # parent-chain walks and no materialized subtree list
+            max_depth = 0
+            stack = [(self.root_item, 0)]
+            while stack:
+                item, depth = stack.pop()
+                if depth > max_depth:
+                    max_depth = depth
+                next_depth = depth + 1
+                for child_item in item.child_items:
+                    stack.append((child_item, next_depth))
+            self._max_depth_cache = max_depth
+        return self._max_depth_cache
+
+    def _invalidate_max_depth(self):
+        self._max_depth_cache = None
 
     def dump(self):
         self.root_item.dump()
 
 
+class _HierarchyScannerSignals(QObject):
+    finished = Signal(object)
+
+
+class _HierarchyScanner(QRunnable):
+    """ Builds a ZarrTreeItem tree off the GUI thread.
+
+    The items are plain Python objects, so construction is thread-safe;
+    only the model swap (reset_root_item) happens on the GUI thread, via
+    the queued finished signal.
+    """
+
+    def __init__(self,
+                 root: zarr.hierarchy.Group | zarr.core.Array,
+                 path: str = None,
+                 include_attrs: bool = False,
+                 include_arrays: bool = True,
+                 include_groups: bool = True
+                 ):
+        QRunnable.__init__(self)
+        self.signals = _HierarchyScannerSignals()
+        self._args = (root, path, include_attrs, include_arrays, include_groups)
+
+    def run(self):
+        self.signals.finished.emit(build_tree(*self._args))
+
+
+class ZarrAttrsModel(ZarrTreeModel):
+    """ Attrs-only model for the attributes pane.
+
+    Binds the attrs-only configuration in one place so selection changes
+    just call set_object. With groups and arrays excluded, the build path
+    never scans the hierarchy: it is one attrs read per nesting level, and
+    the slotted ZarrTreeItem keeps per-row overhead small, so the full
+    editing machinery (rename, insert, delete) is shared rather than
+    duplicated in a second model class.
+    """
+
+    def __init__(self,
+                 obj: zarr.hierarchy.Group | zarr.core.Array,
+                 parent: QObject = None
+                 ):
+        ZarrTreeModel.__init__(self, obj,
+                               path=None,
+                               include_attrs=True,
+                               include_arrays=False,
+                               include_groups=False,
+                               parent=parent)
+
+    def set_object(self, obj: zarr.hierarchy.Group | zarr.core.Array):
+        self.reset_model(obj,
+                         path=None,
+                         include_attrs=True,
+                         include_arrays=False,
+                         include_groups=False)
+
+
 class ZarrTreeView(QTreeView):
     def __init__(self, parent: QWidget = None):
         QTreeView.__init__(self, parent)
         
         self.setAlternatingRowColors(True)
+        # every row is one line of text with a 16px icon, so let Qt lay out
+        # rows by multiplication instead of measuring each visible one
+        self.setUniformRowHeights(True)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
@@ -971,6 +1323,34 @@ class ZarrTreeView(QTreeView):
         self.setDropIndicatorShown(True)
         # self.setDefaultDropAction(Qt.MoveAction)
         self.setDragDropMode(QAbstractItemView.InternalMove)
+
+        self._buildContextMenus()
+
+    def _buildContextMenus(self):
+        # the menus are static apart from which index they act on, so build
+        # them once and just rebind self._contextIndex per right-click
+        # instead of allocating a QMenu plus a dozen QActions each time
+        self._contextIndex = QModelIndex()
+
+        # str() -> '', int() -> 0, etc.; calling the factory per trigger
+        # ensures each insert gets its own fresh dict/list
+        attr_types = [('str', str), ('int', int), ('float', float), ('dict', dict), ('list', list)]
+
+        self._groupMenu = QMenu(self)
+        self._groupMenu.addAction('Insert Group', lambda: self.insert_group(self._contextIndex))
+        self._groupDeleteSeparator = self._groupMenu.addSeparator()
+        self._groupDeleteAction = self._groupMenu.addAction('Delete', lambda: self.remove_row(self._contextIndex))
+
+        self._attrMenu = QMenu(self)
+        insertAttrMenu = self._attrMenu.addMenu('Insert Attribute')
+        for label, factory in attr_types:
+            insertAttrMenu.addAction(label, lambda factory=factory: self.insert_attribute(self._contextIndex, None, factory()))
+        self._appendChildAttrSeparator = self._attrMenu.addSeparator()
+        self._appendChildAttrMenu = self._attrMenu.addMenu('Append Child Attribute')
+        for label, factory in attr_types:
+            self._appendChildAttrMenu.addAction(label, lambda factory=factory: self.append_child_attribute(self._contextIndex, None, factory()))
+        self._attrMenu.addSeparator()
+        self._attrMenu.addAction('Delete Attribute', lambda: self.remove_row(self._contextIndex))
     
     @Slot(QPoint)
     def onCustomContextMenuRequested(self, pos: QPoint):
@@ -987,39 +1367,40 @@ class ZarrTreeView(QTreeView):
         
         model: ZarrTreeModel = self.model()
         item: ZarrTreeItem = model.get_item(index)
+        self._contextIndex = index
 
         if item.isgroup() or item.isarray():
-            menu = QMenu()
-            menu.addAction('Insert Group', lambda: self.insert_group(index))
-            # menu.addAction('Insert Array')
-            if item.parent() is item.root() and item.parent().child_count() == 1:
-                # Don't allow deleting the final child of root
-                # as this will result in an empty tree.
-                return menu
-            menu.addSeparator()
-            menu.addAction('Delete', lambda: self.remove_row(index))
-            return menu
+            # don't allow deleting the final child of root
+            # as this would result in an empty tree
+            can_delete = not (item.parent() is item.root() and item.parent().child_count() == 1)
+            self._groupDeleteSeparator.setVisible(can_delete)
+            self._groupDeleteAction.setVisible(can_delete)
+            return self._groupMenu
         elif item.isattr():
-            menu = QMenu()
-            insertAttrMenu = menu.addMenu('Insert Attribute')
-            insertAttrMenu.addAction('str', lambda: self.insert_attribute(index, None, ''))
-            insertAttrMenu.addAction('int', lambda: self.insert_attribute(index, None, 0))
-            insertAttrMenu.addAction('float', lambda: self.insert_attribute(index, None, 0.0))
-            insertAttrMenu.addAction('dict', lambda: self.insert_attribute(index, None, {}))
-            insertAttrMenu.addAction('list', lambda: self.insert_attribute(index, None, []))
-            attr = item.attr()
-            if isinstance(attr, dict) or isinstance(attr, list):
-                menu.addSeparator()
-                appendChildAttrMenu = menu.addMenu('Append Child Attribute')
-                appendChildAttrMenu.addAction('str', lambda: self.append_child_attribute(index, None, ''))
-                appendChildAttrMenu.addAction('int', lambda: self.append_child_attribute(index, None, 0))
-                appendChildAttrMenu.addAction('float', lambda: self.append_child_attribute(index, None, 0.0))
-                appendChildAttrMenu.addAction('dict', lambda: self.append_child_attribute(index, None, {}))
-                appendChildAttrMenu.addAction('list', lambda: self.append_child_attribute(index, None, []))
-            menu.addSeparator()
-            menu.addAction('Delete Attribute', lambda: self.remove_row(index))
-            return menu
+            # only dict/list attrs can take child attrs (cached type, no store read)
+            is_container = item.attr_value_type() in (dict, list)
+            self._appendChildAttrSeparator.setVisible(is_container)
+            self._appendChildAttrMenu.menuAction().setVisible(is_container)
+            return self._attrMenu
     
+    def resizeAllColumnsToContents(self):
+        # one header layout pass over all sections instead of a separate
+        # visible-row measurement per column
+        self.header().resizeSections(QHeaderView.ResizeMode.ResizeToContents)
+
+    def expandAllItems(self):
+        # expandRecursively (Qt >= 5.13) expands in one pass without firing
+        # per-item expanded signals; repaints are suspended either way so the
+        # view relayouts once instead of once per expanded node
+        self.setUpdatesEnabled(False)
+        try:
+            if hasattr(self, 'expandRecursively'):
+                self.expandRecursively(_ROOT_INDEX)
+            else:
+                self.expandAll()
+        finally:
+            self.setUpdatesEnabled(True)
+
     def insert_group(self, index: QModelIndex, path: str = None):
         model: ZarrTreeModel = self.model()
         model.insert_group(index.row(), path, index.parent())
@@ -1039,18 +1420,13 @@ class ZarrTreeView(QTreeView):
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         index: QModelIndex = event.source().currentIndex()
-        # model: ZarrTreeModel = self.model()
-        # item: ZarrTreeItem = model.get_item(index)
-        # print(item)
-        # print(event.dropAction() == Qt.DropAction.MoveAction)
-        # print(event.dropAction() == Qt.DropAction.CopyAction)
-        if index and index != QModelIndex():
+        if index and index != _ROOT_INDEX:
             self._indexBeingDragged = index
             event.acceptProposedAction()
     
     def dropEvent(self, event: QDropEvent):
         src_index: QModelIndex = getattr(self, '_indexBeingDragged', None)
-        if not src_index or src_index == QModelIndex():
+        if not src_index or src_index == _ROOT_INDEX:
             return
         dst_index: QModelIndex = self.indexAt(event.pos()) # TODO: event.position() in Qt6?
         if not dst_index:
@@ -1065,7 +1441,6 @@ class ZarrTreeView(QTreeView):
         drop_pos = self.dropIndicatorPosition()
         dst_item = model.get_item(dst_index)
         if drop_pos == QAbstractItemView.OnItem:
-            # print('OnItem')
             if dst_item.isgroup():
                 # append src_index as last child of dst_index
                 dst_parent_index = dst_index
@@ -1073,17 +1448,14 @@ class ZarrTreeView(QTreeView):
             # otherwise insert src_index as prior sibling of dst_index
             pass
         elif drop_pos == QAbstractItemView.AboveItem:
-            # print('AboveItem')
             # insert src_index as prior sibling of dst_index
             pass
         elif drop_pos == QAbstractItemView.BelowItem:
-            # print('BelowItem')
             # insert src_index as sibling just after dst_index
             dst_row += 1
         elif drop_pos == QAbstractItemView.OnViewport:
-            # print('OnViewport')
             # append src_index as last child of root
-            dst_parent_index = QModelIndex()
+            dst_parent_index = _ROOT_INDEX
             dst_row = model.rowCount(dst_parent_index)
 
         old_max_depth = model.max_depth()
@@ -1097,27 +1469,42 @@ class ZarrTreeView(QTreeView):
 
 
 class ZarrViewer(QSplitter):
-    def __init__(self, root: zarr.hierarchy.Group | zarr.core.Array, path: str = None):
+    def __init__(self,
+                 root: zarr.hierarchy.Group | zarr.core.Array,
+                 path: str = None,
+                 lazy: bool = False,
+                 background_scan: bool = False
+                 ):
         QSplitter.__init__(self)
 
-        self.hierarchy_model = ZarrTreeModel(root, 
-                                             path=path, 
-                                             include_attrs=False, 
-                                             include_arrays=True, 
-                                             include_groups=True)
+        # lazy => only populate tree items for hierarchy levels the user actually expands
+        # background_scan => show the viewer immediately (populating on demand)
+        # while the full tree is built off the GUI thread and swapped in when ready
+        self._lazy = lazy
+
+        # rendered info text per zarr path (str(obj.info) rebuilds the whole
+        # summary each call and dominates click latency on large groups);
+        # cleared on any structural edit or rename (see _clearInfoCache
+        # connections below) and in setTree, since a path can be freed by a
+        # rename and later reused by a different object
+        self._info_cache = {}
+
+        self.hierarchy_model = ZarrTreeModel(root,
+                                             path=path,
+                                             include_attrs=False,
+                                             include_arrays=True,
+                                             include_groups=True,
+                                             lazy=lazy or background_scan)
         self.hierarchy_view = ZarrTreeView()
         self.hierarchy_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.hierarchy_view.setModel(self.hierarchy_model)
-        self.hierarchy_view.expandAll()
+        if not lazy and not background_scan:
+            self.hierarchy_view.expandAllItems()
 
-        self.attr_model = ZarrTreeModel(root, 
-                                        path=path, 
-                                        include_attrs=True, 
-                                        include_arrays=False, 
-                                        include_groups=False)
+        self.attr_model = ZarrAttrsModel(root)
         self.attr_view = ZarrTreeView()
         self.attr_view.setModel(self.attr_model)
-        self.attr_view.expandAll()
+        self.attr_view.expandAllItems()
 
         self.pathLineEdit = QLineEdit()
         if path is not None:
@@ -1128,19 +1515,19 @@ class ZarrViewer(QSplitter):
         self.expandToDepthSpinBox = QSpinBox()
         max_depth = self.hierarchy_model.max_depth()
         self.expandToDepthSpinBox.setMinimum(0)
-        self.expandToDepthSpinBox.setMaximum(max_depth - 1)
+        self.expandToDepthSpinBox.setMaximum(max(0, max_depth - 1))
         self.expandToDepthSpinBox.setToolTip('Expand to Depth')
         self.expandToDepthSpinBox.valueChanged.connect(self.expandToDepth)
 
         self.collapseAllButton = QToolButton()
         self.collapseAllButton.setFixedSize(16, 16)
-        self.collapseAllButton.setIcon(qta.icon('mdi6.arrow-collapse-left'))
+        self.collapseAllButton.setIcon(_icon('mdi6.arrow-collapse-left'))
         self.collapseAllButton.setToolTip('Collapse All')
         self.collapseAllButton.clicked.connect(self.collapseAll)
 
         self.expandAllButton = QToolButton()
         self.expandAllButton.setFixedSize(16, 16)
-        self.expandAllButton.setIcon(qta.icon('mdi6.arrow-expand-right'))
+        self.expandAllButton.setIcon(_icon('mdi6.arrow-expand-right'))
         self.expandAllButton.setToolTip('Expand All')
         self.expandAllButton.clicked.connect(self.expandAll)
 
@@ -1166,7 +1553,9 @@ class ZarrViewer(QSplitter):
         vbox.addLayout(hierarchyDepthLayout)
         vbox.addWidget(self.hierarchy_view)
 
-        self.info_text = QTextEdit()
+        # QPlainTextEdit skips QTextEdit's rich-text document engine,
+        # which is pure overhead for a read-only monospaced summary
+        self.info_text = QPlainTextEdit()
         self.info_text.setReadOnly(True)
         self.info_text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
         self.updateInfo(root)
@@ -1183,57 +1572,118 @@ class ZarrViewer(QSplitter):
         self.setStretchFactor(0, 2)
         self.setStretchFactor(1, 1)
 
+        # the zarr object the attr/info panels currently show
+        # (init built them for root just above)
+        self._selected_obj = root
+
+        # coalesce bursts of selection changes (e.g. holding an arrow key)
+        # into a single attr/info panel rebuild
+        self._selectionUpdateTimer = QTimer(self)
+        self._selectionUpdateTimer.setSingleShot(True)
+        self._selectionUpdateTimer.setInterval(50)
+        self._selectionUpdateTimer.timeout.connect(self._updateSelectedItemPanels)
+
         self.hierarchy_view.selectionModel().selectionChanged.connect(self.onSelectionChanged)
         self.hierarchy_model.infoChanged.connect(self.onInfoChanged)
         self.hierarchy_model.maxDepthChanged.connect(self.onMaxDepthChanged)
+        # structural edits (insert/remove/drag-drop) change member counts of
+        # parents whose paths are unchanged, and renames (infoChanged) free a
+        # path that a later rename can hand to a different object, so any
+        # cached info may be stale after either
+        self.hierarchy_model.rowsInserted.connect(self._clearInfoCache)
+        self.hierarchy_model.rowsRemoved.connect(self._clearInfoCache)
+        self.hierarchy_model.rowsMoved.connect(self._clearInfoCache)
+        self.hierarchy_model.infoChanged.connect(self._clearInfoCache)
 
         self.collapseAll()
-    
-    def setTree(self, root: zarr.hierarchy.Group | zarr.core.Array, path: str = None):
-        self.hierarchy_model.reset_model(root, 
-                                         path=path, 
-                                         include_attrs=False, 
-                                         include_arrays=True, 
-                                         include_groups=True)
-
-        self.hierarchy_view.selectionModel().clearSelection()
-        self.hierarchy_view.selectionModel().selectionChanged.connect(self.onSelectionChanged)
 
+        self._hierarchy_scanner = None
+        if background_scan and not lazy:
+            scanner = _HierarchyScanner(root, path)
+            scanner.signals.finished.connect(self._onHierarchyScanFinished)
+            # keep a reference so the signals object outlives the scan
+            self._hierarchy_scanner = scanner
+            QThreadPool.globalInstance().start(scanner)
+
+    @Slot(object)
+    def _onHierarchyScanFinished(self, root_item: ZarrTreeItem):
+        self._hierarchy_scanner = None
+        self.hierarchy_model.reset_root_item(root_item)
         max_depth = self.hierarchy_model.max_depth()
-        self.expandToDepthSpinBox.setMaximum(max_depth - 1)
-        self.collapseAll()
+        self.expandToDepthSpinBox.setMaximum(max(0, max_depth - 1))
 
-        self.attr_model.reset_model(root, 
-                                    path=None, 
-                                    include_attrs=True, 
-                                    include_arrays=False, 
-                                    include_groups=False)
-        self.attr_view.expandAll()
+    def setTree(self, root: zarr.hierarchy.Group | zarr.core.Array, path: str = None):
+        # one paint at the end: suspend view updates and mute the selection
+        # model (clearing the selection on a fresh model should not trigger
+        # a panel rebuild; the panels are reset to root explicitly below)
+        selection_model = self.hierarchy_view.selectionModel()
+        self.hierarchy_view.setUpdatesEnabled(False)
+        self.attr_view.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            self.hierarchy_model.reset_model(root,
+                                             path=path,
+                                             include_attrs=False,
+                                             include_arrays=True,
+                                             include_groups=True,
+                                             lazy=self._lazy)
+            selection_model.clearSelection()
+
+            max_depth = self.hierarchy_model.max_depth()
+            self.expandToDepthSpinBox.setMaximum(max(0, max_depth - 1))
+            self.collapseAll()
 
+            self.attr_model.set_object(root)
+            self.attr_view.expandAllItems()
+        finally:
+            selection_model.blockSignals(False)
+            self.attr_view.setUpdatesEnabled(True)
+            self.hierarchy_view.setUpdatesEnabled(True)
+
+        self._selected_obj = root
+        self._info_cache.clear()
         self.updateInfo(root)
     
     def updateInfo(self, obj: zarr.hierarchy.Group | zarr.core.Array):
-        # print(obj.info_items())
-        self.info_text.setPlainText(str(obj.info))
+        text = self._info_cache.get(obj.path)
+        if text is None:
+            text = self._info_cache[obj.path] = str(obj.info)
+        self.info_text.setPlainText(text)
+
+    @Slot()
+    def _clearInfoCache(self):
+        self._info_cache.clear()
     
     @Slot()
     def onSelectionChanged(self):
-        indexes: list[QModelIndex] = self.hierarchy_view.selectionModel().selectedIndexes()
-        if not indexes:
+        # restarting the single-shot timer cancels any pending rebuild,
+        # so only the last selection in a burst updates the panels
+        self._selectionUpdateTimer.start()
+
+    @Slot()
+    def _updateSelectedItemPanels(self):
+        # currentIndex is a single O(1) query, whereas selectedIndexes
+        # materializes a list of every selected cell across all columns
+        index: QModelIndex = self.hierarchy_view.selectionModel().currentIndex()
+        if not index.isValid():
             obj = None
         else:
-            # first index will be the item for column 0 in the selected row
-            item: ZarrTreeItem = self.hierarchy_model.get_item(indexes[0])
+            item: ZarrTreeItem = self.hierarchy_model.get_item(index)
             # item will be for either a zarr group or array
             obj = item.item_data
-        self.attr_model.reset_model(obj, 
-                                    path=None, 
-                                    include_attrs=True, 
-                                    include_arrays=False, 
-                                    include_groups=False)
-        self.attr_view.expandAll()
-        for col in range(2):
-            self.attr_view.resizeColumnToContents(col)
+        if obj is self._selected_obj:
+            # re-selection of the same object (common during drag/drop and
+            # programmatic selection restores): panels are already current
+            # (renames/moves rebind item_data to a new object, so they pass)
+            return
+        self._selected_obj = obj
+        self.attr_view.setUpdatesEnabled(False)
+        try:
+            self.attr_model.set_object(obj)
+            self.attr_view.expandAllItems()
+            self.attr_view.resizeAllColumnsToContents()
+        finally:
+            self.attr_view.setUpdatesEnabled(True)
         self.updateInfo(obj)
     
     @Slot()
@@ -1248,20 +1698,23 @@ class ZarrViewer(QSplitter):
     def collapseAll(self):
         self.hierarchy_view.collapseAll()
         if self.expandToDepthSpinBox.value() != 0:
-            self.expandToDepthSpinBox.valueChanged.disconnect(self.expandToDepth)
-            self.expandToDepthSpinBox.setValue(0)
-            self.expandToDepthSpinBox.valueChanged.connect(self.expandToDepth)
+            # QSignalBlocker instead of a disconnect/connect dance: no
+            # connection-list churn, and exception-safe
+            with QSignalBlocker(self.expandToDepthSpinBox):
+                self.expandToDepthSpinBox.setValue(0)
     
     @Slot()
     def expandAll(self):
-        self.hierarchy_view.expandAll()
-        for col in range(2):
-            self.hierarchy_view.resizeColumnToContents(col)
+        self.hierarchy_view.setUpdatesEnabled(False)
+        try:
+            self.hierarchy_view.expandAllItems()
+            self.hierarchy_view.resizeAllColumnsToContents()
+        finally:
+            self.hierarchy_view.setUpdatesEnabled(True)
         max_depth = self.expandToDepthSpinBox.maximum()
         if self.expandToDepthSpinBox.value() != max_depth:
-            self.expandToDepthSpinBox.valueChanged.disconnect(self.expandToDepth)
-            self.expandToDepthSpinBox.setValue(max_depth)
-            self.expandToDepthSpinBox.valueChanged.connect(self.expandToDepth)
+            with QSignalBlocker(self.expandToDepthSpinBox):
+                self.expandToDepthSpinBox.setValue(max_depth)
     
     @Slot(int)
     def expandToDepth(self, depth: int = None):
@@ -1272,13 +1725,15 @@ class ZarrViewer(QSplitter):
         elif depth < 0 or depth >= self.expandToDepthSpinBox.maximum():
             self.expandAll()
         else:
-            self.hierarchy_view.expandToDepth(depth - 1)
-            for col in range(2):
-                self.hierarchy_view.resizeColumnToContents(col)
+            self.hierarchy_view.setUpdatesEnabled(False)
+            try:
+                self.hierarchy_view.expandToDepth(depth - 1)
+                self.hierarchy_view.resizeAllColumnsToContents()
+            finally:
+                self.hierarchy_view.setUpdatesEnabled(True)
             if self.expandToDepthSpinBox.value() != depth:
-                self.expandToDepthSpinBox.valueChanged.disconnect(self.expandToDepth)
-                self.expandToDepthSpinBox.setValue(depth)
-                self.expandToDepthSpinBox.valueChanged.connect(self.expandToDepth)
+                with QSignalBlocker(self.expandToDepthSpinBox):
+                    self.expandToDepthSpinBox.setValue(depth)
     
     @Slot(QModelIndex)
     def onInfoChanged(self, index: QModelIndex):
@@ -1286,4 +1741,4 @@ class ZarrViewer(QSplitter):
     
     @Slot(int)
     def onMaxDepthChanged(self, max_depth: int):
-        self.expandToDepthSpinBox.setMaximum(max_depth - 1)
+        self.expandToDepthSpinBox.setMaximum(max(0, max_depth - 1))
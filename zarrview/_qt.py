@@ -0,0 +1,17 @@
+""" Resolve the installed Qt binding (PySide6, PyQt6, or PyQt5) exactly once.
+
+Scripts that only need a couple of Qt names (e.g., QApplication) can import
+them from here instead of repeating the try/except ladder and star-importing
+the entire QtWidgets module:
+
+    from zarrview._qt import QApplication
+"""
+
+
+try:
+    from PySide6.QtWidgets import QApplication
+except ImportError:
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        from PyQt5.QtWidgets import QApplication
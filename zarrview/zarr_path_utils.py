@@ -2,9 +2,17 @@
 """
 
 
+import collections
+import functools
 import re
+import sys
 import zarr
 
+# module-level aliases so hot loops use an exact type check (type(obj) is _Group)
+# instead of isinstance, which walks the MRO and re-resolves zarr attributes per node
+_Array = zarr.core.Array
+_Group = zarr.hierarchy.Group
+
 
 def index_exp(exp: str) -> tuple[int | list[int] | slice]:
     """ Convert index expression string to tuple of slices or index lists for each dimension.
@@ -25,7 +33,23 @@ def index_exp(exp: str) -> tuple[int | list[int] | slice]:
     """
     
     # split each comma-separated index expression for each dimension into separate parts
-    parts = re.split(r',(?=[^\]]*(?:\[|$))', exp)
+    if '[' not in exp:
+        # common case: no bracketed index lists, so every comma is a separator
+        parts = exp.split(',')
+    else:
+        # scan with a bracket depth counter so commas inside [...] lists don't split
+        parts = []
+        depth = 0
+        start = 0
+        for i, c in enumerate(exp):
+            if c == '[':
+                depth += 1
+            elif c == ']':
+                depth -= 1
+            elif c == ',' and depth == 0:
+                parts.append(exp[start:i])
+                start = i + 1
+        parts.append(exp[start:])
     
     # convert each part to a slice or list of indices
     slices = []
@@ -80,13 +104,12 @@ def name_index_exp(exp: str) -> tuple[str, tuple[int | list[int] | slice]]:
         exp = 'group[1:3, 14, [5, 7, 8]]'
         -> ('group', (slice(1, 3, None), 14, [5, 7, 8]))
     """
-    if exp.endswith(']'):
-        pos = exp.find('[')
-        if pos != -1:
-            name = exp[:pos].strip()
-            ind = exp[pos+1:-1]
-            return name, index_exp(ind)
-    return exp, ()
+    # plain names (the common case) bail out on one cheap check each
+    if not exp.endswith(']') or (pos := exp.find('[')) == -1:
+        return exp, ()
+    name = exp[:pos].strip()
+    ind = exp[pos+1:-1]
+    return name, index_exp(ind)
 
 def test_name_index_exp():
     all_ok = True
@@ -113,7 +136,13 @@ def slice_path(path: str) -> tuple[tuple[str, tuple[int | list[int] | slice]]]:
             ('trace', (slice(None, None, None),))
             )
     """
-    return tuple(name_index_exp(part.strip()) for part in path.strip('/').split('/'))
+    s = path.strip('/')
+    if '/' not in s:
+        # single-segment fast path: the common case for GUI selections
+        return (name_index_exp(s.strip()),)
+    # tuple(map(...)) beats a generator expression: map runs in C and
+    # tuple() can consume it without the generator frame per item
+    return tuple(map(name_index_exp, map(str.strip, s.split('/'))))
 
 def test_slice_path():
     all_ok = True
@@ -154,8 +183,16 @@ def path_slice_regex(path: str | tuple[tuple[str, tuple[int | list[int] | slice]
         captured indexes are in their associated slices.
     """
     if isinstance(path, str):
-        # convert path string to slice path
-        path = slice_path(path)
+        # memoized: a GUI refreshing a view rebuilds the same path slice repeatedly
+        return _path_slice_regex(path)
+    return _build_path_slice_regex(path)
+
+@functools.lru_cache(maxsize=128)
+def _path_slice_regex(path_slice: str) -> tuple[str, list[slice]]:
+    return _build_path_slice_regex(slice_path(path_slice))
+
+def _build_path_slice_regex(path: tuple[tuple[str, tuple[int | list[int] | slice]]]
+                            ) -> tuple[str, list[slice]]:
     regex = ''
     capture_group_slices = []
     for name, indices in path:
@@ -190,23 +227,193 @@ def path_slice_regex(path: str | tuple[tuple[str, tuple[int | list[int] | slice]
                         regex += '\\.([0-9]+)'
                         capture_group_slices.append(ind)
                     else:
-                        # only one of the specified indices
-                        indexes = range(*ind.indices(ind.stop))
-                        regex += '\\.(?:' + '|'.join([str(i) for i in indexes]) + ')'
+                        # capture the index and check it against the slice afterwards,
+                        # same as for open-ended slices: enumerating the range as an
+                        # alternation makes the regex huge for large stops
+                        regex += '\\.([0-9]+)'
+                        capture_group_slices.append(ind)
             regex += '/'
     return regex.strip('/'), capture_group_slices
 
-def path_in_slice(path: str, path_slice: str | tuple[str, list[slice]]) -> bool:
+def _fast_int(s: str) -> int:
+    """ Parse a small non-negative ASCII decimal, or return -1 if s is not one.
+
+        Zarr index suffixes are short (usually 1-3 digits); a plain digit loop
+        skips int()'s argument handling and folds the validation that callers
+        would otherwise do with isascii()/isdigit() into the parse. Only
+        '0'-'9' are accepted, so non-ASCII digits still reject.
+    """
+    n = 0
+    for c in s:
+        d = ord(c) - 48
+        if d < 0 or d > 9:
+            return -1
+        n = n * 10 + d
+    return n if s else -1
+
+
+def _literal_predicate(name: str):
+    """ matches one path segment exactly (e.g. 'run' or 'run.0') """
+    # intern the literal so comparison against interned candidates is a
+    # pointer check; non-interned candidates fall through to ==
+    return lambda seg, _name=sys.intern(name): seg is _name or seg == _name
+
+
+def _any_predicate(seg: str) -> bool:
+    """ matches any one path segment ('*' and '...') """
+    return True
+
+
+def _indexed_predicate(name: str, indices: tuple[int | list[int] | slice]):
+    """ matches 'name.i' or 'name.i.j...' where each dotted index satisfies its predicate """
+    preds = tuple(_index_predicate(ind) for ind in indices)
+
+    # everything the per-node check needs is bound as a default-arg local
+    def match(seg: str, _name=name, _n=len(name), _preds=preds, _npreds=len(preds),
+              _fast_int=_fast_int) -> bool:
+        if len(seg) <= _n or seg[_n] != '.' or not seg.startswith(_name):
+            return False
+        fields = seg[_n + 1:].split('.')
+        if len(fields) != _npreds:
+            return False
+        for field, pred in zip(fields, _preds):
+            # _fast_int validates and parses in one pass (-1 means not an index)
+            index = _fast_int(field)
+            if index < 0 or not pred(index):
+                return False
+        return True
+
+    return match
+
+
+def _index_predicate(ind: int | list[int] | slice):
+    """ return a predicate index -> bool for one index expression """
+    if isinstance(ind, int):
+        return lambda i, _i=ind: i == _i
+    if isinstance(ind, list):
+        return lambda i, _s=frozenset(ind): i in _s
+    # slice
+    if ind == slice(None):
+        return lambda i: True
+    if ind.stop is None:
+        # open-ended slice: membership is just start/step arithmetic
+        start = ind.start or 0
+        step = ind.step or 1
+        return lambda i, _start=start, _step=step: i >= _start and (i - _start) % _step == 0
+    indexes = range(*ind.indices(ind.stop))
+    if len(indexes) <= 1024:
+        return lambda i, _s=frozenset(indexes): i in _s
+    # very large bounded slice: arithmetic beats materializing a huge set
+    # (these predicates are held by the _compile_slice cache)
+    start = ind.start or 0
+    step = ind.step or 1
+    return lambda i, _start=start, _stop=ind.stop, _step=step: \
+        _start <= i < _stop and (i - _start) % _step == 0
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_slice(path_slice: str) -> tuple:
+    """ Parse a path slice string once into a flat per-segment matcher kernel.
+
+        All parsing/bookkeeping happens here; the per-node work is reduced to
+        calling plain predicate closures from parallel tuples, with no method
+        dispatch or instance attribute loads (see _match_parts).
+
+        Returns (preds, any_depth, is_exact):
+            preds: one seg -> bool predicate per path slice segment
+            any_depth: True where the segment is '...' (branching handled by the walker)
+            is_exact: no '...' present; every other segment consumes exactly one
+                path segment, so matching is a direct segment-for-segment compare
+    """
+    preds = []
+    any_depth = []
+    for name, indices in slice_path(path_slice):
+        if name == '...' and indices == ():
+            preds.append(_any_predicate)
+            any_depth.append(True)
+            continue
+        if name == '*' and indices == ():
+            preds.append(_any_predicate)
+        elif indices == ():
+            preds.append(_literal_predicate(name))
+        else:
+            preds.append(_indexed_predicate(name, indices))
+        any_depth.append(False)
+    return tuple(preds), tuple(any_depth), not any(any_depth)
+
+def _advance_states(states: set[int], seg: str, preds: tuple, any_depth: tuple) -> set[int]:
+    """ Advance the set of live matcher positions by one path segment.
+
+        Position j means the first j segment matchers are fully matched by the
+        segments consumed so far. '...' consumes at least one segment, so it
+        both stays live (to absorb more segments) and advances past itself.
+        An empty result means no continuation of the path can ever match.
+    """
+    new_states = set()
+    nmatchers = len(preds)
+    for j in states:
+        if j >= nmatchers:
+            continue
+        if any_depth[j]:
+            new_states.add(j)
+            new_states.add(j + 1)
+        elif preds[j](seg):
+            new_states.add(j + 1)
+    return new_states
+
+def _match_parts(parts: list[str], compiled: tuple) -> bool:
+    """ walk path segments against the output of _compile_slice """
+    preds, any_depth, is_exact = compiled
+    if is_exact:
+        # every matcher consumes exactly one segment: direct compare, no state sets
+        if len(parts) != len(preds):
+            return False
+        for seg, pred in zip(parts, preds):
+            if not pred(seg):
+                return False
+        return True
+    states = {0}
+    for seg in parts:
+        states = _advance_states(states, seg, preds, any_depth)
+        if not states:
+            return False
+    return len(preds) in states
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_path_slice_regex(path_slice: str) -> tuple[re.Pattern, tuple[slice]]:
+    """ path_slice_regex with the regex precompiled, memoized on the path slice string.
+
+        Matching a path slice against every node of a large hierarchy would otherwise
+        rebuild and re-parse the same regex once per node.
+    """
+    # zarr paths are ASCII, so keep the regex engine out of Unicode handling
+    regex, capture_group_slices = path_slice_regex(path_slice)
+    return re.compile(regex, re.ASCII), tuple(capture_group_slices)
+
+def path_in_slice(path: str, path_slice: str | tuple[str | re.Pattern, list[slice] | tuple[slice]]) -> bool:
     if isinstance(path_slice, str):
-        regex, group_slices = path_slice_regex(path_slice)
+        return _match_parts(path.split('/'), _compile_slice(path_slice))
+    regex, group_slices = path_slice  # output from path_slice_regex or _compiled_path_slice_regex
+    if isinstance(regex, str):
+        result = re.fullmatch(regex, path)
     else:
-        regex, group_slices = path_slice  # output from path_slice_regex
-    result = re.fullmatch(regex, path)
+        result = regex.fullmatch(path)
     if result is None:
         return False
-    for group, group_slice in zip(result.groups(), group_slices):
-        index = int(group)
-        if index not in range(*group_slice.indices(index + 1)):
+    return _check_capture_groups(result.groups(), group_slices)
+
+def _check_capture_groups(groups: tuple[str], group_slices: list[slice] | tuple[slice]) -> bool:
+    """ check that each captured path index is in its associated slice """
+    for group, group_slice in zip(groups, group_slices):
+        # direct start/stop/step arithmetic instead of slice.indices plus a
+        # range allocation per group per node; groups are regex-validated [0-9]+
+        index = _fast_int(group)
+        start = group_slice.start or 0
+        if index < start or (index - start) % (group_slice.step or 1):
+            return False
+        stop = group_slice.stop
+        if stop is not None and index >= stop:
             return False
     return True
 
@@ -305,16 +512,22 @@ def test_path_in_slice():
 
 
 def find_first(root: zarr.hierarchy.Group, name: str, include_arrays: bool = True, include_groups: bool = True) -> zarr.hierarchy.Group | zarr.core.Array | None:
-    def _find_first(obj):
-        if isinstance(obj, zarr.core.Array) and not include_arrays:
-            return
-        if isinstance(obj, zarr.hierarchy.Group) and not include_groups:
-            return
-        objname = obj.path.strip('/').split('/')[-1]
-        if name == objname or name == objname.split('.')[0]:
-            return obj
-    
-    return root.visitvalues(_find_first)
+    """ Breadth-first search that stops at the first match.
+
+        An explicit queue instead of visitvalues avoids visiting every
+        descendant of subtrees explored before the match is found.
+    """
+    queue = collections.deque([root])
+    while queue:
+        group = queue.popleft()
+        for objname, obj in group.items():
+            if type(obj) is _Group:
+                if include_groups and (name == objname or name == objname.split('.')[0]):
+                    return obj
+                queue.append(obj)
+            elif include_arrays and (name == objname or name == objname.split('.')[0]):
+                return obj
+    return None
 
 def test_find_first():
     root = zarr.group()
@@ -361,20 +574,30 @@ def test_find_first():
     return all_ok
 
 
-def find_all(root: zarr.hierarchy.Group, name: str, include_arrays: bool = True, include_groups: bool = True) -> list[zarr.hierarchy.Group | zarr.core.Array]:
-    objects = []
+def find_all_iter(root: zarr.hierarchy.Group, name: str, include_arrays: bool = True, include_groups: bool = True):
+    """ Lazily yield all matches in depth-first (visitvalues) order.
 
-    def _find_all(obj):
-        if isinstance(obj, zarr.core.Array) and not include_arrays:
-            return
-        if isinstance(obj, zarr.hierarchy.Group) and not include_groups:
-            return
-        objname = obj.path.strip('/').split('/')[-1]
-        if name == objname or name == objname.split('.')[0]:
-            objects.append(obj)
-    
-    root.visitvalues(_find_all)
-    return objects
+        An explicit-stack generator instead of visitvalues, so callers that
+        only need the first match (e.g. next(find_all_iter(...), None)) stop
+        the traversal early instead of paying for a full-tree walk.
+    """
+    # skip_mask[False] applies to arrays, skip_mask[True] to groups
+    skip_mask = (not include_arrays, not include_groups)
+    stack = [iter(root.items())]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        objname, obj = entry
+        isgroup = type(obj) is _Group
+        if not skip_mask[isgroup] and (name == objname or name == objname.split('.')[0]):
+            yield obj
+        if isgroup:
+            stack.append(iter(obj.items()))
+
+def find_all(root: zarr.hierarchy.Group, name: str, include_arrays: bool = True, include_groups: bool = True) -> list[zarr.hierarchy.Group | zarr.core.Array]:
+    return list(find_all_iter(root, name, include_arrays, include_groups))
 
 def test_find_all():
     root = zarr.group()
@@ -435,23 +658,40 @@ def test_find_all():
 def find_leaves(root: zarr.hierarchy.Group, path_slice: str, 
                 include_arrays: bool = True, include_groups: bool = True
                 ) -> list[zarr.hierarchy.Group | zarr.core.Array]:
-    regex, group_slices = path_slice_regex(path_slice)
+    # resolve the compiled segment matcher kernel once before traversal
+    preds, any_depth, is_exact = _compile_slice(path_slice)
+    nmatchers = len(preds)
+    leaves_only = path_slice.endswith('...')
     objects = []
 
-    def _find_leaves(obj):
-        if isinstance(obj, zarr.core.Array) and not include_arrays:
-            return
-        if isinstance(obj, zarr.hierarchy.Group) and not include_groups:
-            return
-        if path_in_slice(obj.path.strip('/'), (regex, group_slices)):
-            if path_slice.endswith('...'):
-                # only accept true leaves
-                if not isinstance(obj, zarr.hierarchy.Group) or len(obj.keys()) == 0:
-                    objects.append(obj)
-            else:
-                objects.append(obj)
-    
-    root.visitvalues(_find_leaves)
+    # explicit depth-first walk in visitvalues order, carrying the live matcher
+    # positions for each group so subtrees that can never match are pruned
+    # instead of visited (visitvalues would walk every descendant unconditionally)
+    stack = [(iter(root.items()), {0})]
+    # hoist the remaining per-node lookups out of the loop
+    push = stack.append
+    pop = stack.pop
+    append = objects.append
+    advance = _advance_states
+    Group = _Group
+    while stack:
+        it, states = stack[-1]
+        entry = next(it, None)
+        if entry is None:
+            pop()
+            continue
+        objname, obj = entry
+        child_states = advance(states, objname, preds, any_depth)
+        if not child_states:
+            continue
+        isgroup = type(obj) is Group
+        if nmatchers in child_states:
+            if (include_arrays or isgroup) and (include_groups or not isgroup):
+                # for a trailing '...' only accept true leaves
+                if not leaves_only or not isgroup or len(obj.keys()) == 0:
+                    append(obj)
+        if isgroup:
+            push((iter(obj.items()), child_states))
     return objects
 
 def test_find_leaves():